@@ -1,12 +1,42 @@
 #!/usr/bin/env python3
 """Entry point for running meridian_cli as a module (python -m meridian_cli)"""
 
+import asyncio
 import os
+import sys
 import logging
 from .app import MeridianCLI
 from .logger import setup_logging
 
 
+def _install_uvloop(logger: logging.Logger) -> None:
+    """Run the app on uvloop when the optional dependency is installed
+
+    Textual starts its loop via asyncio.run(), which picks up the policy.
+    uvloop has no Windows support, so the default loop is kept there.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        # Optional "speedups" extra, so it may not be installed
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        logger.debug("uvloop not installed - using default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
+def _confirm_min_chars(logger: logging.Logger) -> int:
+    """MERIDIAN_CONFIRM_MIN_CHARS, or 0 (always confirm) if unset or invalid"""
+    value = os.getenv("MERIDIAN_CONFIRM_MIN_CHARS", "0")
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        logger.warning("Ignoring invalid MERIDIAN_CONFIRM_MIN_CHARS=%r", value)
+        return 0
+
+
 def main():
     """Entry point for the CLI"""
     # Initialize logging
@@ -17,7 +47,8 @@ def main():
     base_url = os.getenv("MERIDIAN_BASE_URL", "http://localhost:8080")
     logger.info(f"Starting Meridian CLI with base_url={base_url}")
 
-    app = MeridianCLI(base_url)
+    _install_uvloop(logger)
+    app = MeridianCLI(base_url, confirm_min_chars=_confirm_min_chars(logger))
     app.run()
 
 
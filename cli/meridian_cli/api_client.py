@@ -1,19 +1,136 @@
 import httpx
-import json
 import logging
+import orjson
+import sys
 from typing import AsyncIterator
-from .models import Project, Chat, Turn, PaginatedTurnsResponse, CreateTurnResponse
+from pydantic import TypeAdapter
+from .models import Project, Chat, Turn, PaginatedTurnsResponse, CreateTurnResponse, StreamEvent
 
 logger = logging.getLogger("meridian_cli.api_client")
 
+# Built once at import: validating list responses straight from JSON bytes
+# runs entirely in pydantic-core, without materializing Python dicts first
+_PROJECT_LIST = TypeAdapter(list[Project])
+_CHAT_LIST = TypeAdapter(list[Chat])
+
+
+# Initial size of the reusable SSE read buffer; grows only for oversized events
+_SSE_BUFFER_SIZE = 64 * 1024
+
+
+def _parse_sse_event(
+    buf: bytearray, start: int, stop: int
+) -> tuple[str, bytes | bytearray, int, int] | None:
+    """Parse the raw SSE event in buf[start:stop] into its event type and data
+
+    Returns (event_type, data_buf, data_start, data_stop), where the payload
+    is data_buf[data_start:data_stop]. A single-line data field is located
+    by offset within the shared read buffer (no copy); multi-line data
+    fields are joined with newlines per the SSE spec into a new bytes.
+
+    Returns None for events missing either field (comments, keep-alives).
+    """
+    event_type = None
+    data_ranges: list[tuple[int, int]] = []
+
+    pos = start
+    while pos < stop:
+        line_end = buf.find(b"\n", pos, stop)
+        if line_end == -1:
+            line_end = stop
+        if buf.startswith(b"event: ", pos, line_end):
+            # Interned so consumers can compare against constants by identity
+            event_type = sys.intern(buf[pos + 7 : line_end].decode())
+        elif buf.startswith(b"data: ", pos, line_end):
+            data_ranges.append((pos + 6, line_end))
+        pos = line_end + 1
+
+    if event_type is None or not data_ranges:
+        return None
+    if len(data_ranges) == 1:
+        data_start, data_stop = data_ranges[0]
+        return event_type, buf, data_start, data_stop
+    joined = b"\n".join(buf[a:b] for a, b in data_ranges)
+    return event_type, joined, 0, len(joined)
+
+
+# Exact byte layout of the backend's BlockDeltaEvent for text deltas
+# (Go encoding/json: struct field order, no whitespace)
+_TEXT_DELTA_PREFIX = b'{"block_index":'
+_TEXT_DELTA_TYPE_KEY = b',"delta_type":"'
+_TEXT_DELTA_TEXT_KEY = b'","text_delta":"'
+
+
+def _parse_text_delta(buf: bytes | bytearray, start: int, stop: int) -> dict | None:
+    """Decode a text block_delta payload without the generic JSON parser
+
+    Text deltas are nearly every event in a stream and have a fixed shape:
+        {"block_index":N,"delta_type":"...","text_delta":"..."}
+    so the fields can be sliced straight out of the bytes. Anything that
+    doesn't match exactly - extra fields, or any backslash escape that would
+    need JSON string decoding - returns None and goes through orjson.
+    """
+    if not (
+        buf.startswith(_TEXT_DELTA_PREFIX, start, stop)
+        and buf.endswith(b'"}', start, stop)
+    ):
+        return None
+    type_key = buf.find(_TEXT_DELTA_TYPE_KEY, start, stop)
+    if type_key == -1:
+        return None
+    type_start = type_key + len(_TEXT_DELTA_TYPE_KEY)
+    text_key = buf.find(_TEXT_DELTA_TEXT_KEY, type_start, stop)
+    if text_key == -1:
+        return None
+    text_start = text_key + len(_TEXT_DELTA_TEXT_KEY)
+    text_stop = stop - 2
+
+    # Unescaped strings can't contain quotes, so a quote inside either value
+    # means the payload has other fields we'd be skipping
+    if (
+        buf.find(b"\\", type_start, stop) != -1
+        or buf.find(b'"', type_start, text_key) != -1
+        or buf.find(b'"', text_start, text_stop) != -1
+    ):
+        return None
+
+    try:
+        return {
+            "block_index": int(buf[start + len(_TEXT_DELTA_PREFIX) : type_key]),
+            "delta_type": sys.intern(buf[type_start:text_key].decode()),
+            "text_delta": buf[text_start:text_stop].decode(),
+        }
+    except (ValueError, UnicodeDecodeError):
+        return None
+
 
 class APIClient:
     """Async HTTP client for Meridian API"""
 
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=30.0)
-        logger.debug(f"APIClient initialized with base_url={self.base_url}")
+        # One long-lived pool for the whole session. The generous keep-alive
+        # expiry keeps the backend connection warm between user actions (the
+        # httpx default of 5s evicts it while the user is reading a turn).
+        # HTTP/2 is negotiated via ALPN, so it only kicks in over https.
+        # The transport retries failed connection attempts (refused/reset
+        # while connecting) instead of surfacing them to the screens; it
+        # never replays a request that already reached the server.
+        transport = httpx.AsyncHTTPTransport(
+            retries=2,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=120.0,
+            ),
+        )
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            transport=transport,
+            timeout=30.0,
+        )
+        logger.debug("APIClient initialized with base_url=%s", self.base_url)
 
     async def close(self):
         """Close the HTTP client"""
@@ -24,44 +141,44 @@ class APIClient:
     async def get_projects(self) -> list[Project]:
         """GET /api/projects"""
         logger.debug("API Request: GET /api/projects")
-        response = await self.client.get(f"{self.base_url}/api/projects")
+        response = await self.client.get("/api/projects")
         response.raise_for_status()
-        projects = [Project(**p) for p in response.json()]
-        logger.debug(f"API Response: 200 OK ({len(projects)} projects)")
+        projects = _PROJECT_LIST.validate_json(response.content)
+        logger.debug("API Response: 200 OK (%d projects)", len(projects))
         return projects
 
     async def create_project(self, name: str) -> Project:
         """POST /api/projects"""
-        logger.debug(f"API Request: POST /api/projects (name={name})")
+        logger.debug("API Request: POST /api/projects (name=%s)", name)
         response = await self.client.post(
-            f"{self.base_url}/api/projects", json={"name": name}
+            "/api/projects", json={"name": name}
         )
         response.raise_for_status()
-        project = Project(**response.json())
-        logger.debug(f"API Response: 200 OK (created project id={project.id})")
+        project = Project.model_validate_json(response.content)
+        logger.debug("API Response: 200 OK (created project id=%s)", project.id)
         return project
 
     # Chat endpoints
     async def get_chats(self, project_id: str) -> list[Chat]:
         """GET /api/chats?project_id={project_id}"""
-        logger.debug(f"API Request: GET /api/chats?project_id={project_id}")
+        logger.debug("API Request: GET /api/chats?project_id=%s", project_id)
         response = await self.client.get(
-            f"{self.base_url}/api/chats", params={"project_id": project_id}
+            "/api/chats", params={"project_id": project_id}
         )
         response.raise_for_status()
-        chats = [Chat(**c) for c in response.json()]
-        logger.debug(f"API Response: 200 OK ({len(chats)} chats)")
+        chats = _CHAT_LIST.validate_json(response.content)
+        logger.debug("API Response: 200 OK (%d chats)", len(chats))
         return chats
 
     async def create_chat(self, project_id: str, title: str) -> Chat:
         """POST /api/chats"""
-        logger.debug(f"API Request: POST /api/chats (project_id={project_id}, title={title})")
+        logger.debug("API Request: POST /api/chats (project_id=%s, title=%s)", project_id, title)
         response = await self.client.post(
-            f"{self.base_url}/api/chats", json={"project_id": project_id, "title": title}
+            "/api/chats", json={"project_id": project_id, "title": title}
         )
         response.raise_for_status()
-        chat = Chat(**response.json())
-        logger.debug(f"API Response: 200 OK (created chat id={chat.id})")
+        chat = Chat.model_validate_json(response.content)
+        logger.debug("API Response: 200 OK (created chat id=%s)", chat.id)
         return chat
 
     # Turn endpoints
@@ -77,13 +194,15 @@ class APIClient:
         if from_turn_id:
             params["from_turn_id"] = from_turn_id
 
-        logger.debug(f"API Request: GET /api/chats/{chat_id}/turns (params={params})")
+        logger.debug("API Request: GET /api/chats/%s/turns (params=%s)", chat_id, params)
         response = await self.client.get(
-            f"{self.base_url}/api/chats/{chat_id}/turns", params=params
+            f"/api/chats/{chat_id}/turns", params=params
         )
         response.raise_for_status()
-        result = PaginatedTurnsResponse(**response.json())
-        logger.debug(f"API Response: 200 OK ({len(result.turns)} turns)")
+        result = PaginatedTurnsResponse.model_validate_json(response.content)
+        # The HTTP version shows whether neighbour prefetches share one
+        # multiplexed HTTP/2 connection
+        logger.debug("API Response: 200 OK (%d turns, %s)", len(result.turns), response.http_version)
         return result
 
     async def create_turn(
@@ -91,73 +210,125 @@ class APIClient:
         chat_id: str,
         prev_turn_id: str | None,
         content: str,
-        params: dict,
+        params_json: bytes,
     ) -> CreateTurnResponse:
-        """POST /api/chats/{chat_id}/turns to create a new user turn and assistant turn"""
-        logger.debug(f"API Request: POST /api/chats/{chat_id}/turns (prev_turn_id={prev_turn_id}, content_len={len(content)})")
-        response = await self.client.post(
-            f"{self.base_url}/api/chats/{chat_id}/turns",
-            json={
+        """POST /api/chats/{chat_id}/turns to create a new user turn and assistant turn
+
+        params_json is the request params object already serialized as JSON
+        (see MeridianCLI.current_params_json); it is embedded verbatim.
+        """
+        logger.debug(
+            "API Request: POST /api/chats/%s/turns (prev_turn_id=%s, content_len=%d)",
+            chat_id, prev_turn_id, len(content),
+        )
+        body = orjson.dumps(
+            {
                 "prev_turn_id": prev_turn_id,
                 "role": "user",
                 "turn_blocks": [{"block_type": "text", "text_content": content}],
-                "request_params": params,
-            },
+                "request_params": orjson.Fragment(params_json),
+            }
+        )
+        response = await self.client.post(
+            f"/api/chats/{chat_id}/turns",
+            content=body,
+            headers={"Content-Type": "application/json"},
         )
         response.raise_for_status()
-        result = CreateTurnResponse(**response.json())
-        logger.debug(f"API Response: 200 OK (user_turn={result.user_turn.id}, assistant_turn={result.assistant_turn.id})")
+        result = CreateTurnResponse.model_validate_json(response.content)
+        logger.debug(
+            "API Response: 200 OK (user_turn=%s, assistant_turn=%s)",
+            result.user_turn.id, result.assistant_turn.id,
+        )
         return result
 
-    async def stream_turn(self, turn_id: str) -> AsyncIterator[dict]:
+    async def stream_turn(self, turn_id: str) -> AsyncIterator[StreamEvent]:
         """GET /api/turns/{turn_id}/stream - SSE streaming"""
-        logger.debug(f"API Request: GET /api/turns/{turn_id}/stream (SSE)")
+        logger.debug("API Request: GET /api/turns/%s/stream (SSE)", turn_id)
         async with self.client.stream(
             "GET",
-            f"{self.base_url}/api/turns/{turn_id}/stream",
+            f"/api/turns/{turn_id}/stream",
             headers={"Accept": "text/event-stream"},
             timeout=300.0,  # 5 minutes for streaming
         ) as response:
             response.raise_for_status()
-            logger.debug(f"SSE stream connected: {response.status_code} OK")
-
-            event_type = None
-            data_lines = []
-
-            async for line in response.aiter_lines():
-                if line.startswith("event: "):
-                    event_type = line[7:]
-                elif line.startswith("data: "):
-                    data_lines.append(line[6:])
-                elif line == "":
-                    # Empty line marks end of event
-                    if event_type and data_lines:
-                        # Join multi-line data and parse JSON
-                        data_str = "\n".join(data_lines)
-                        try:
-                            data = json.loads(data_str)
-                            # Log event with relevant details
-                            if event_type == "block_delta":
-                                delta_type = data.get("delta_type", "unknown")
-                                text_len = len(data.get("text_delta", ""))
-                                logger.debug(f"SSE Event: {event_type} (delta_type={delta_type}, text_len={text_len})")
-                            else:
-                                logger.debug(f"SSE Event: {event_type} (data_keys={list(data.keys())})")
-                            yield {"event": event_type, "data": data}
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"SSE malformed JSON: {e} (data={data_str[:100]})")
-
-                        # Reset for next event
-                        event_type = None
-                        data_lines = []
-
-            logger.debug(f"SSE stream ended for turn {turn_id}")
+            logger.debug("SSE stream connected: %d OK", response.status_code)
+
+            # Read into one reusable buffer and split on blank-line event
+            # boundaries by offset: one tokenized delta per event makes
+            # per-line str dispatch and per-event slice copies the dominant
+            # cost of the streaming loop. Unread bytes live in buf[start:end].
+            buf = bytearray(_SSE_BUFFER_SIZE)
+            start = end = 0
+            # Level doesn't change mid-stream; check once instead of per event
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            async for chunk in response.aiter_bytes():
+                size = len(chunk)
+                if end + size > len(buf):
+                    # Out of room: slide the unread tail (usually a partial
+                    # event) to the front, then grow only if still too small
+                    pending = end - start
+                    buf[:pending] = buf[start:end]
+                    start, end = 0, pending
+                    if end + size > len(buf):
+                        buf.extend(bytes(end + size - len(buf)))
+                # A boundary may straddle the previous chunk's last byte
+                scan = max(start, end - 1)
+                buf[end : end + size] = chunk
+                end += size
+
+                while (boundary := buf.find(b"\n\n", scan, end)) != -1:
+                    parsed = _parse_sse_event(buf, start, boundary)
+                    start = scan = boundary + 2
+
+                    if parsed is None:
+                        continue
+
+                    event_type, data_buf, data_start, data_stop = parsed
+                    data = None
+                    if event_type == "block_delta":
+                        data = _parse_text_delta(data_buf, data_start, data_stop)
+                    if data is None:
+                        # Release the view before the buffer can be resized
+                        with memoryview(data_buf)[data_start:data_stop] as payload:
+                            try:
+                                # orjson parses the buffer directly - no copy or decode
+                                data = orjson.loads(payload)
+                            except orjson.JSONDecodeError as e:
+                                logger.warning("SSE malformed JSON: %s (data=%r)", e, payload[:100].tobytes())
+                                continue
+                        if event_type == "block_delta" and isinstance(data, dict):
+                            # Intern like the fast path does
+                            delta_type = data.get("delta_type")
+                            if isinstance(delta_type, str):
+                                data["delta_type"] = sys.intern(delta_type)
+
+                    # Log event with relevant details (skipped entirely unless
+                    # DEBUG is on - this runs once per streamed token)
+                    if debug:
+                        if event_type == "block_delta":
+                            logger.debug(
+                                "SSE Event: %s (delta_type=%s, text_len=%d)",
+                                event_type,
+                                data.get("delta_type", "unknown"),
+                                len(data.get("text_delta") or ""),
+                            )
+                        else:
+                            logger.debug("SSE Event: %s (data_keys=%s)", event_type, list(data))
+                    yield StreamEvent(event_type, data)
+
+                if start == end:
+                    # Everything consumed - rewind so the buffer never compacts
+                    start = end = 0
+
+            logger.debug("SSE stream ended for turn %s", turn_id)
 
     async def interrupt_turn(self, turn_id: str) -> None:
         """POST /api/turns/{turn_id}/interrupt to cancel streaming"""
-        logger.debug(f"API Request: POST /api/turns/{turn_id}/interrupt")
+        logger.debug("API Request: POST /api/turns/%s/interrupt", turn_id)
         response = await self.client.post(
-            f"{self.base_url}/api/turns/{turn_id}/interrupt"
+            f"/api/turns/{turn_id}/interrupt"
         )
         response.raise_for_status()
-        logger.debug(f"API Response: 200 OK (turn {turn_id} interrupted)")
+        logger.debug("API Response: 200 OK (turn %s interrupted)", turn_id)
@@ -1,18 +1,28 @@
 """Meridian CLI - Main Textual application"""
 
+import asyncio
 import logging
+import orjson
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Mapping
 from textual.app import App
 from textual.binding import Binding
 from .api_client import APIClient
-from .screens import (
-    ProjectListScreen,
-    ChatListScreen,
-    TurnBrowserScreen,
-)
+from .logger import LOG_DIR, cleanup_old_logs
+from .models import Chat
+from . import screens
+from .screens.project_list import ProjectListScreen
 
 logger = logging.getLogger("meridian_cli.app")
 
 
+def _log_prefetch_failure(task: asyncio.Task) -> None:
+    """Done-callback for chat prefetches: retrieve and log any failure"""
+    if not task.cancelled() and (e := task.exception()) is not None:
+        logger.debug("Chat prefetch failed: %s", e)
+
+
 class MeridianCLI(App):
     """Main Textual application for Meridian CLI"""
 
@@ -24,16 +34,20 @@ class MeridianCLI(App):
 
     SCREENS = {
         "project_list": ProjectListScreen,
-        "chat_list": ChatListScreen,
-        "turn_browser": TurnBrowserScreen,
+        # Imported on first push - the app always starts on the project list
+        "chat_list": lambda: screens.ChatListScreen(),
+        "turn_browser": lambda: screens.TurnBrowserScreen(),
         # ConfirmationScreen and ParamsEditorScreen are instantiated directly
         # since they require parameters
     }
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, confirm_min_chars: int = 0):
         super().__init__()
         self.base_url = base_url
         self.api_client = APIClient(base_url)
+        # Messages shorter than this are sent without the confirmation screen
+        # (0 confirms everything)
+        self.confirm_min_chars = confirm_min_chars
 
         # Global state
         self.current_project_id: str | None = None
@@ -46,22 +60,85 @@ class MeridianCLI(App):
             "thinking_enabled": True,
         }
 
+        # In-flight/finished chat list fetches started ahead of navigation,
+        # keyed by project_id (see prefetch_chats)
+        self._chats_prefetch: dict[str, asyncio.Task[list[Chat]]] = {}
+
         # Double Ctrl+C state
         self._ctrl_c_pressed_once = False
         self._ctrl_c_timer = None
 
         logger.debug(f"MeridianCLI initialized with base_url={base_url}")
 
+    @property
+    def current_params(self) -> Mapping[str, Any]:
+        """LLM request params (read-only view; assign a new mapping to change)"""
+        return self._current_params
+
+    @current_params.setter
+    def current_params(self, params: Mapping[str, Any]) -> None:
+        # Params change rarely but are sent with every turn: serialize once
+        # here. The copy is frozen so the cached JSON can't drift from it.
+        params = dict(params)
+        self._current_params = MappingProxyType(params)
+        self._current_params_json = orjson.dumps(params)
+
+    @property
+    def current_params_json(self) -> bytes:
+        """current_params pre-serialized as a JSON object"""
+        return self._current_params_json
+
     def on_mount(self) -> None:
         """Initialize app with project list screen"""
         logger.debug("App mounted - pushing project_list screen")
         self.push_screen("project_list")
 
+        # Log cleanup globs/stats/unlinks the log directory - keep that disk
+        # I/O off the event loop so the first screen paints immediately
+        self.run_worker(
+            partial(cleanup_old_logs, LOG_DIR, keep_count=10),
+            name="cleanup_old_logs",
+            thread=True,
+        )
+
     async def on_unmount(self) -> None:
         """Cleanup when app exits"""
         logger.info("App unmounting - cleaning up")
+        for task in self._chats_prefetch.values():
+            task.cancel()
         await self.api_client.close()
 
+    def prefetch_chats(self, project_id: str) -> None:
+        """Start loading a project's chats in the background
+
+        Called while the user is still on the project list, so the request
+        overlaps with their think time instead of starting on selection.
+        """
+        if project_id in self._chats_prefetch:
+            return
+        logger.debug("Prefetching chats for project_id=%s", project_id)
+        task = asyncio.create_task(self.api_client.get_chats(project_id))
+        # The prefetch may never be consumed - retrieve a failure here so
+        # asyncio doesn't report it as never retrieved
+        task.add_done_callback(_log_prefetch_failure)
+        self._chats_prefetch[project_id] = task
+
+    async def fetch_chats(self, project_id: str) -> list[Chat]:
+        """Get a project's chats, using a prefetched result if one exists
+
+        Prefetches are single-use so later visits always see fresh data.
+        A failed prefetch falls back to a normal request.
+        """
+        task = self._chats_prefetch.pop(project_id, None)
+        if task is not None:
+            try:
+                chats = await task
+                logger.debug("Using prefetched chats for project_id=%s", project_id)
+                return chats
+            except Exception as e:
+                logger.warning("Chat prefetch failed for project_id=%s: %s", project_id, e)
+        return await self.api_client.get_chats(project_id)
+
     async def action_handle_ctrl_c(self) -> None:
         """Handle Ctrl+C with double-press-to-quit pattern"""
         # StreamingScreen handles its own Ctrl+C binding
@@ -1,10 +1,16 @@
 """Logging configuration for Meridian CLI"""
 
+import atexit
+import heapq
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 
+LOG_DIR = Path(__file__).parent / "logs"
+
 
 def setup_logging() -> logging.Logger:
     """Initialize logging for the Meridian CLI
@@ -12,20 +18,33 @@ def setup_logging() -> logging.Logger:
     Creates a timestamped log file in meridian_cli/logs/ and configures
     logging to write detailed DEBUG-level logs.
 
+    Records are handed to a background QueueListener thread, so logging
+    calls on the Textual event loop never block on file I/O. Old log
+    cleanup is left to the app (see MeridianCLI.on_mount) so it runs off
+    the event loop as well.
+
     Returns:
         Logger instance configured for the application
     """
-    # Determine log directory
-    cli_dir = Path(__file__).parent
-    log_dir = cli_dir / "logs"
-    log_dir.mkdir(exist_ok=True)
+    LOG_DIR.mkdir(exist_ok=True)
 
     # Generate timestamped log filename
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    log_file = log_dir / f"meridian_{timestamp}.log"
+    log_file = LOG_DIR / f"meridian_{timestamp}.log"
+
+    # Skip per-record context the format never prints. Caller info
+    # (funcName/lineno) needs a sys._getframe() stack walk on every record,
+    # which adds up at SSE event rates; module logger names are specific
+    # enough to locate a message. See "Optimization" in the logging HOWTO.
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Added in 3.12 but missing from the bundled typeshed stubs
+    logging.logAsyncioTasks = False  # pyright: ignore[reportAttributeAccessIssue]
 
     # Configure logging format
-    log_format = "[%(asctime)s] %(levelname)s - %(name)s.%(funcName)s:%(lineno)d - %(message)s"
+    log_format = "[%(asctime)s] %(levelname)s - %(name)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
     # Create file handler
@@ -33,10 +52,19 @@ def setup_logging() -> logging.Logger:
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(log_format, date_format))
 
+    # Only the listener thread touches the file; callers just enqueue
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush remaining records and close the file on interpreter exit
+    atexit.register(listener.stop)
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Create logger for this package
     logger = logging.getLogger("meridian_cli")
@@ -45,9 +73,6 @@ def setup_logging() -> logging.Logger:
     # Log startup
     logger.info(f"Logging initialized - writing to {log_file}")
 
-    # Cleanup old logs
-    cleanup_old_logs(log_dir, keep_count=10)
-
     return logger
 
 
@@ -58,21 +83,29 @@ def cleanup_old_logs(log_dir: Path, keep_count: int = 10) -> None:
         log_dir: Directory containing log files
         keep_count: Number of recent log files to keep (default: 10)
     """
+    logger = logging.getLogger("meridian_cli")
     try:
-        # Find all log files
-        log_files = sorted(
-            log_dir.glob("meridian_*.log"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,  # Most recent first
-        )
+        # One directory scan; DirEntry.stat() is served from the dirent cache
+        # on Windows and avoids building a Path per file elsewhere
+        with os.scandir(log_dir) as it:
+            log_files = [
+                (entry.stat().st_mtime, entry.path, entry.name)
+                for entry in it
+                if entry.name.startswith("meridian_") and entry.name.endswith(".log")
+            ]
+
+        # Pick the most recent keep_count in O(n log k) instead of sorting all
+        survivors = {path for _, path, _ in heapq.nlargest(keep_count, log_files)}
 
         # Delete old files
-        for old_file in log_files[keep_count:]:
+        for _, path, name in log_files:
+            if path in survivors:
+                continue
             try:
-                old_file.unlink()
-                logging.getLogger("meridian_cli").debug(f"Deleted old log file: {old_file.name}")
+                os.unlink(path)
+                logger.debug(f"Deleted old log file: {name}")
             except Exception as e:
-                logging.getLogger("meridian_cli").warning(f"Failed to delete old log {old_file.name}: {e}")
+                logger.warning(f"Failed to delete old log {name}: {e}")
 
     except Exception as e:
-        logging.getLogger("meridian_cli").warning(f"Failed to cleanup old logs: {e}")
+        logger.warning(f"Failed to cleanup old logs: {e}")
@@ -1,8 +1,22 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
+from functools import cached_property
+from typing import Any, NamedTuple
 
+# Block types whose text_content is shown as turn text
+_TEXTISH = frozenset({"text", "thinking"})
 
-class TurnBlock(BaseModel):
+
+class APIModel(BaseModel):
+    """Base for models parsed from API responses
+
+    Responses are treated as read-only snapshots; frozen models make any
+    accidental mutation fail loudly instead of drifting from the server.
+    """
+    model_config = ConfigDict(frozen=True)
+
+
+class TurnBlock(APIModel):
     """Represents a content block within a turn"""
     id: str
     turn_id: str
@@ -13,7 +27,7 @@ class TurnBlock(BaseModel):
     created_at: datetime
 
 
-class Turn(BaseModel):
+class Turn(APIModel):
     """Represents a single turn in a conversation"""
     id: str
     chat_id: str
@@ -32,7 +46,9 @@ class Turn(BaseModel):
     blocks: list[TurnBlock] = []
     sibling_ids: list[str] = []  # INCLUDES current turn's ID, ordered by created_at
 
-    @property
+    # Turns are frozen, so derived values are computed once per instance
+    # (sibling_index is read by both the display and NavigationState)
+    @cached_property
     def sibling_index(self) -> int:
         """Current position in sibling list (0-indexed)"""
         try:
@@ -40,32 +56,46 @@ class Turn(BaseModel):
         except ValueError:
             return 0
 
-    @property
+    @cached_property
+    def short_id(self) -> str:
+        """Abbreviated ID shown in turn headers"""
+        return self.id[:8]
+
+    @cached_property
     def text_content(self) -> str:
         """Extract text content from blocks"""
-        texts = [
+        return "\n".join(
             block.text_content
             for block in self.blocks
-            if block.text_content and block.block_type in ["text", "thinking"]
-        ]
-        return "\n".join(texts) if texts else ""
+            if block.text_content and block.block_type in _TEXTISH
+        )
 
 
-class CreateTurnResponse(BaseModel):
+class CreateTurnResponse(APIModel):
     """Response from POST /api/chats/{id}/turns"""
     user_turn: Turn
     assistant_turn: Turn
     stream_url: str
 
 
-class PaginatedTurnsResponse(BaseModel):
+class PaginatedTurnsResponse(APIModel):
     """Response from GET /api/chats/{id}/turns"""
     turns: list[Turn]
     has_more_before: bool
     has_more_after: bool
 
 
-class Chat(BaseModel):
+class StreamEvent(NamedTuple):
+    """One SSE event from GET /api/turns/{id}/stream
+
+    A plain tuple rather than an APIModel - the stream yields one per token,
+    and the payload is consumed as-is without validation.
+    """
+    event: str
+    data: dict[str, Any]
+
+
+class Chat(APIModel):
     """Represents a chat/conversation"""
     id: str
     title: str
@@ -74,7 +104,7 @@ class Chat(BaseModel):
     updated_at: datetime
 
 
-class Project(BaseModel):
+class Project(APIModel):
     """Represents a project"""
     id: str
     name: str
@@ -2,61 +2,61 @@ from .models import Turn, PaginatedTurnsResponse
 
 
 class NavigationState:
-    """Handles all arrow key navigation logic for turn browsing"""
+    """Handles all arrow key navigation logic for turn browsing
+
+    Only the neighbouring turn IDs are kept, so the response the state was
+    built from isn't retained for as long as the turn stays on screen.
+    """
 
     def __init__(self, current_turn: Turn, response: PaginatedTurnsResponse):
-        self.current = current_turn
-        self.response = response
+        self._parent = current_turn.prev_turn_id
+        # Turns come back in path order - the one after the current turn is its first child
+        self._first_child = response.turns[1].id if len(response.turns) > 1 else None
+        siblings = current_turn.sibling_ids
+        idx = current_turn.sibling_index
+        self._prev_sibling = siblings[idx - 1] if idx > 0 else None
+        self._next_sibling = siblings[idx + 1] if idx < len(siblings) - 1 else None
 
     # ↑ Key: Navigate to parent turn
     @property
     def can_go_up(self) -> bool:
         """Check if we can navigate to parent"""
-        return self.current.prev_turn_id is not None
+        return self._parent is not None
 
     @property
     def prev_turn_id(self) -> str | None:
         """Get parent turn ID for ↑ navigation"""
-        return self.current.prev_turn_id
+        return self._parent
 
     # ↓ Key: Navigate to child turn
     @property
     def can_go_down(self) -> bool:
         """Check if we can navigate to child (first child)"""
-        return len(self.response.turns) > 1
+        return self._first_child is not None
 
     @property
     def next_turn_id(self) -> str | None:
         """Get first child turn ID for ↓ navigation"""
-        if len(self.response.turns) > 1:
-            return self.response.turns[1].id
-        return None
+        return self._first_child
 
     # ← Key: Navigate to previous sibling
     @property
     def can_go_left(self) -> bool:
         """Check if we can navigate to previous sibling"""
-        return self.current.sibling_index > 0
+        return self._prev_sibling is not None
 
     @property
     def prev_sibling_id(self) -> str | None:
         """Get previous sibling turn ID for ← navigation"""
-        idx = self.current.sibling_index
-        if idx > 0:
-            return self.current.sibling_ids[idx - 1]
-        return None
+        return self._prev_sibling
 
     # → Key: Navigate to next sibling
     @property
     def can_go_right(self) -> bool:
         """Check if we can navigate to next sibling"""
-        idx = self.current.sibling_index
-        return idx < len(self.current.sibling_ids) - 1
+        return self._next_sibling is not None
 
     @property
     def next_sibling_id(self) -> str | None:
         """Get next sibling turn ID for → navigation"""
-        idx = self.current.sibling_index
-        if idx < len(self.current.sibling_ids) - 1:
-            return self.current.sibling_ids[idx + 1]
-        return None
+        return self._next_sibling
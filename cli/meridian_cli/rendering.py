@@ -0,0 +1,66 @@
+"""Markup lines for displaying a turn
+
+The turn browser and the streaming screen both show a turn as a metadata
+header followed by its content blocks. Lines are returned as lists so each
+screen can join them into a single RichLog.write - every write runs a
+separate render/layout pass.
+"""
+
+from rich.markup import escape
+from .models import Turn, TurnBlock
+
+# Fixed part of the header; optional lines are appended after it
+_HEADER_TEMPLATE = (
+    "[bold cyan]Turn ID:[/bold cyan] {id}\n"
+    "[bold cyan]Role:[/bold cyan] {role}\n"
+    "[bold cyan]Status:[/bold cyan] {status}"
+)
+
+# Block types whose text content is shown
+_TEXTLIKE_BLOCKS = frozenset({"thinking", "text"})
+
+# Marker lines for the common block types (brackets escaped so they aren't read as tags)
+_BLOCK_MARKERS = {
+    block_type: f"[dim]\\[{block_type}][/dim]"
+    for block_type in ("thinking", "text", "tool_use", "tool_result")
+}
+
+
+def turn_header_lines(turn: Turn) -> list[str]:
+    """Metadata lines, plus model, error and sibling position when present"""
+    lines = [
+        _HEADER_TEMPLATE.format_map({
+            "id": turn.short_id,
+            "role": turn.role,
+            "status": turn.status,
+        })
+    ]
+
+    if turn.model:
+        lines.append(f"[bold cyan]Model:[/bold cyan] {turn.model}")
+
+    if turn.error:
+        lines.append(f"[red]Error:[/red] {escape(turn.error)}")
+
+    total = len(turn.sibling_ids)
+    if total > 1:
+        lines.append(f"[dim]Sibling {turn.sibling_index + 1} of {total}[/dim]")
+
+    return lines
+
+
+def block_lines(blocks: list[TurnBlock]) -> list[str]:
+    """Lines for content blocks - text is escaped so brackets in it aren't read as markup"""
+    lines: list[str] = []
+    append = lines.append
+    for block in blocks:
+        block_type = block.block_type
+        text = block.text_content
+        marker = _BLOCK_MARKERS.get(block_type)
+        if marker is None:
+            marker = f"[dim]\\[{block_type}][/dim]"
+        append(marker)
+        if text and block_type in _TEXTLIKE_BLOCKS:
+            append(escape(text))
+        append("")
+    return lines
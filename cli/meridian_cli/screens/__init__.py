@@ -1,11 +1,28 @@
-"""UI screens for the Meridian CLI"""
+"""UI screens for the Meridian CLI
 
-from .project_list import ProjectListScreen
-from .chat_list import ChatListScreen
-from .turn_browser import TurnBrowserScreen
-from .confirmation import ConfirmationScreen
-from .params_editor import ParamsEditorScreen
-from .streaming import StreamingScreen
+Screen classes are imported on first access (PEP 562) so startup only
+loads the modules for the screens actually shown.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .project_list import ProjectListScreen
+    from .chat_list import ChatListScreen
+    from .turn_browser import TurnBrowserScreen
+    from .confirmation import ConfirmationScreen
+    from .params_editor import ParamsEditorScreen
+    from .streaming import StreamingScreen
+
+_SCREEN_MODULES = {
+    "ProjectListScreen": ".project_list",
+    "ChatListScreen": ".chat_list",
+    "TurnBrowserScreen": ".turn_browser",
+    "ConfirmationScreen": ".confirmation",
+    "ParamsEditorScreen": ".params_editor",
+    "StreamingScreen": ".streaming",
+}
 
 __all__ = [
     "ProjectListScreen",
@@ -15,3 +32,13 @@ __all__ = [
     "ParamsEditorScreen",
     "StreamingScreen",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _SCREEN_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    screen_cls = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = screen_cls
+    return screen_cls
@@ -5,10 +5,22 @@ from textual.widgets import Header, Footer, ListView, ListItem, Label, Input, Bu
 from textual.containers import Container, Vertical
 from textual.binding import Binding
 from ..models import Chat
+from .item_list import ItemListScreen
 
 logger = logging.getLogger("meridian_cli.screens.chat_list")
 
 
+def _chat_item(chat: Chat) -> ListItem:
+    """Build a list row for a chat
+
+    Only the ID is kept on the row - holding the full Chat model would pin
+    every response object in the widget tree for the screen's lifetime.
+    """
+    item = ListItem(Label(chat.title), classes="chat-item")
+    item.chat_id = chat.id
+    return item
+
+
 class NewChatDialog(Screen):
     """Modal dialog for creating a new chat"""
 
@@ -31,11 +43,12 @@ class NewChatDialog(Screen):
         )
 
     def on_mount(self) -> None:
-        self.query_one("#chat-title", Input).focus()
+        self._title_input = self.query_one("#chat-title", Input)
+        self._title_input.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "create":
-            title = self.query_one("#chat-title", Input).value.strip()
+            title = self._title_input.value.strip()
             if title:
                 self.dismiss(title)
         else:
@@ -45,9 +58,13 @@ class NewChatDialog(Screen):
         self.dismiss(None)
 
 
-class ChatListScreen(Screen):
+class ChatListScreen(ItemListScreen):
     """Chat selection/creation screen"""
 
+    LIST_ID = "chat-list"
+    ITEM_CLASS = "chat-item"
+    EMPTY_MESSAGE = "No chats yet. Press 'n' to create one."
+
     BINDINGS = [
         Binding("n", "new_chat", "New Chat"),
         Binding("escape", "back", "Back to Projects"),
@@ -57,45 +74,30 @@ class ChatListScreen(Screen):
         yield Header()
         yield Container(
             Label("Select a Chat", classes="screen-title"),
-            ListView(id="chat-list"),
+            ListView(id=self.LIST_ID),
         )
         yield Footer()
 
     async def on_mount(self) -> None:
         """Load chats from API"""
         logger.info(f"ChatList screen mounted for project_id={self.app.current_project_id}")
+        await self._reload_chats()
+
+    async def _reload_chats(self) -> None:
+        """Fetch chats and rebuild the list"""
         try:
-            chats = await self.app.api_client.get_chats(self.app.current_project_id)
-            list_view = self.query_one("#chat-list", ListView)
-
-            if not chats:
-                logger.debug("No chats found - showing empty state")
-                list_view.append(
-                    ListItem(Label("[dim]No chats yet. Press 'n' to create one.[/dim]"))
-                )
-            else:
-                logger.debug(f"Loaded {len(chats)} chats")
-                for chat in chats:
-                    list_view.append(
-                        ListItem(
-                            Label(f"{chat.title}"),
-                            classes="chat-item",
-                        )
-                    )
-                    # Store chat data on the list item
-                    list_view.children[-1].chat_data = chat
-
-            list_view.focus()
+            chats = await self.app.fetch_chats(self.app.current_project_id)
+            logger.debug("Loaded %d chats", len(chats))
+            await self.populate([_chat_item(chat) for chat in chats])
         except Exception as e:
-            logger.error(f"Error loading chats: {e}", exc_info=True)
-            self.app.notify(f"Error loading chats: {e}", severity="error", markup=False)
+            self.report_error("loading chats", e)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Navigate to turn browser for selected chat"""
-        if hasattr(event.item, "chat_data"):
-            chat = event.item.chat_data
-            logger.info(f"Selected chat: {chat.title} (id={chat.id})")
-            self.app.current_chat_id = chat.id
+        chat_id = getattr(event.item, "chat_id", None)
+        if chat_id is not None:
+            logger.info(f"Selected chat: id={chat_id}")
+            self.app.current_chat_id = chat_id
             self.app.push_screen("turn_browser")
 
     async def action_new_chat(self) -> None:
@@ -117,11 +119,9 @@ class ChatListScreen(Screen):
             logger.debug(f"Chat created successfully: {chat.id}")
             self.app.notify(f"Created chat: {title}", severity="information")
 
-            # Reload chat list
-            await self.on_mount()
+            await self.insert_first(_chat_item(chat))
         except Exception as e:
-            logger.error(f"Error creating chat: {e}", exc_info=True)
-            self.app.notify(f"Error creating chat: {e}", severity="error", markup=False)
+            self.report_error("creating chat", e)
 
     def action_back(self) -> None:
         """Return to project list"""
@@ -0,0 +1,60 @@
+import httpx
+import logging
+from typing import ClassVar
+from textual.screen import Screen
+from textual.widgets import ListView, ListItem, Label
+
+
+class ItemListScreen(Screen):
+    """Base for the project and chat lists
+
+    Subclasses compose a ListView with id LIST_ID whose rows carry the
+    ITEM_CLASS class, and build the rows themselves.
+    """
+
+    LIST_ID: ClassVar[str]
+    ITEM_CLASS: ClassVar[str]
+    EMPTY_MESSAGE: ClassVar[str]
+
+    @property
+    def list_view(self) -> ListView:
+        return self.query_one(f"#{self.LIST_ID}", ListView)
+
+    async def populate(self, items: list[ListItem]) -> None:
+        """Rebuild the list from fetched rows in a single mount pass"""
+        list_view = self.list_view
+        await list_view.clear()
+
+        if not items:
+            await list_view.append(ListItem(Label(f"[dim]{self.EMPTY_MESSAGE}[/dim]")))
+        else:
+            # Mount all items at once: appending one by one costs a
+            # layout/style pass per row
+            await list_view.extend(items)
+
+        list_view.focus()
+
+    async def insert_first(self, item: ListItem) -> None:
+        """Show a newly created row without re-fetching the whole list
+
+        The POST response already has everything the list shows. The server
+        lists most recently updated first, so the row goes at the top.
+        """
+        list_view = self.list_view
+        if not list_view.query(f".{self.ITEM_CLASS}"):
+            # Drop the empty-state placeholder
+            await list_view.clear()
+        await list_view.insert(0, [item])
+        list_view.index = 0
+        list_view.focus()
+
+    def report_error(self, action: str, e: Exception) -> None:
+        """Log and notify a failed API call (action reads like "loading chats")"""
+        logger = logging.getLogger(type(self).__module__)
+        if isinstance(e, httpx.HTTPError):
+            # Expected failures (bad status, backend unreachable) are fully
+            # described by the message - skip the traceback formatting
+            logger.warning("Error %s: %s", action, e)
+        else:
+            logger.error("Error %s: %s", action, e, exc_info=True)
+        self.app.notify(f"Error {action}: {e}", severity="error", markup=False)
@@ -33,6 +33,22 @@ MODEL_OPTIONS_BY_PROVIDER: dict[str, list[tuple[str, str]]] = {
 
 DEFAULT_PROVIDER = "lorem"
 
+TEMPERATURE_OPTIONS: tuple[tuple[str, str], ...] = (
+    ("0.0", "0.0"),
+    ("0.5", "0.5"),
+    ("1.0", "1.0"),
+)
+
+# Validators are stateless, so one instance serves every editor
+_INT_VALIDATOR = Integer()
+
+# Valid values for validating the app's current params, built once at import
+PROVIDER_VALUES = frozenset(value for _, value in PROVIDER_OPTIONS)
+MODEL_VALUES_BY_PROVIDER: dict[str, frozenset[str]] = {
+    provider: frozenset(value for _, value in options)
+    for provider, options in MODEL_OPTIONS_BY_PROVIDER.items()
+}
+
 
 class ParamsEditorScreen(Screen):
     """Parameter editor with multiple choice menus (no free text)."""
@@ -43,63 +59,73 @@ class ParamsEditorScreen(Screen):
         Binding("escape", "cancel", "Cancel"),
     ]
 
+    def __init__(self):
+        super().__init__()
+        # Provider the model options are currently built for
+        self._current_provider: str | None = None
+
     def compose(self) -> ComposeResult:
         # Get current params from app
         params = self.app.current_params
 
         provider_value = params.get("provider", DEFAULT_PROVIDER)
-        provider_values = {value for _, value in PROVIDER_OPTIONS}
-        if provider_value not in provider_values:
+        if provider_value not in PROVIDER_VALUES:
             provider_value = DEFAULT_PROVIDER
 
         model_value = params.get("model")
         model_options = MODEL_OPTIONS_BY_PROVIDER.get(provider_value, [])
-        model_values = {value for _, value in model_options}
-        if model_value not in model_values:
+        if model_value not in MODEL_VALUES_BY_PROVIDER.get(provider_value, ()):
             # Fallback to first model for the selected provider
             model_value = model_options[0][1] if model_options else None
 
+        # The provider select echoes its initial value as a Changed event on
+        # mount; recording it here keeps that from resetting the saved model
+        self._current_provider = provider_value
+
+        # Keep references to the value widgets so reads don't walk the DOM
+        self._provider_select = FormSelect(
+            options=PROVIDER_OPTIONS,
+            value=provider_value,
+            id="provider-select",
+        )
+        self._model_select = FormSelect(
+            options=model_options,
+            value=model_value,
+            id="model-select",
+        )
+        self._temperature_select = FormSelect(
+            options=TEMPERATURE_OPTIONS,
+            value=str(params.get("temperature", 1.0)),
+            id="temperature-select",
+        )
+        self._max_tokens_input = Input(
+            value=str(params.get("max_tokens", 128)),
+            id="max-tokens-input",
+            validators=[_INT_VALIDATOR],
+        )
+        self._thinking_checkbox = Checkbox(
+            "Enable 'thinking' stream",
+            value=params.get("thinking_enabled", True),
+            id="thinking-enabled-checkbox",
+        )
+
         yield Container(
             Vertical(
                 Label("Edit Parameters", classes="screen-title"),
                 # Provider selection
                 Label("Provider:", classes="field-label"),
-                FormSelect(
-                    options=PROVIDER_OPTIONS,
-                    value=provider_value,
-                    id="provider-select",
-                ),
+                self._provider_select,
                 # Model selection
                 Label("Model:", classes="field-label"),
-                FormSelect(
-                    options=model_options,
-                    value=model_value,
-                    id="model-select",
-                ),
+                self._model_select,
                 # Temperature selection
                 Label("Temperature:", classes="field-label"),
-                FormSelect(
-                    options=[
-                        ("0.0", "0.0"),
-                        ("0.5", "0.5"),
-                        ("1.0", "1.0"),
-                    ],
-                    value=str(params.get("temperature", 1.0)),
-                    id="temperature-select",
-                ),
+                self._temperature_select,
                 # Max tokens input
                 Label("Max Tokens:", classes="field-label"),
-                Input(
-                    value=str(params.get("max_tokens", 128)),
-                    id="max-tokens-input",
-                    validators=[Integer()],
-                ),
+                self._max_tokens_input,
                 # Thinking enabled checkbox
-                Checkbox(
-                    "Enable 'thinking' stream",
-                    value=params.get("thinking_enabled", True),
-                    id="thinking-enabled-checkbox",
-                ),
+                self._thinking_checkbox,
                 # Buttons
                 Container(
                     Button("Save [Enter]", variant="primary", id="save"),
@@ -113,14 +139,18 @@ class ParamsEditorScreen(Screen):
 
     def on_mount(self) -> None:
         # Start with the provider dropdown focused for keyboard navigation
-        self.query_one("#provider-select", Select).focus()
+        self._provider_select.focus()
 
     def on_select_changed(self, event: Select.Changed) -> None:
         if event.select.id == "provider-select":
             self._update_model_options(event.value)
 
     def _update_model_options(self, provider: str) -> None:
-        model_select = self.query_one("#model-select", Select)
+        if provider == self._current_provider:
+            return
+        self._current_provider = provider
+
+        model_select = self._model_select
         options = MODEL_OPTIONS_BY_PROVIDER.get(provider, [])
         if not options:
             model_select.set_options([])
@@ -147,7 +177,7 @@ class ParamsEditorScreen(Screen):
         """[Enter] key: Save params and return."""
         # Extract values from widgets
         try:
-            max_tokens = int(self.query_one("#max-tokens-input", Input).value)
+            max_tokens = int(self._max_tokens_input.value)
         except (ValueError, TypeError):
             self.app.notify(
                 "Invalid value for Max Tokens. Must be an integer.",
@@ -156,15 +186,11 @@ class ParamsEditorScreen(Screen):
             return
 
         params = {
-            "provider": self.query_one("#provider-select", Select).value,
-            "model": self.query_one("#model-select", Select).value,
-            "temperature": float(
-                self.query_one("#temperature-select", Select).value
-            ),
+            "provider": self._provider_select.value,
+            "model": self._model_select.value,
+            "temperature": float(self._temperature_select.value),
             "max_tokens": max_tokens,
-            "thinking_enabled": self.query_one(
-                "#thinking-enabled-checkbox", Checkbox
-            ).value,
+            "thinking_enabled": self._thinking_checkbox.value,
         }
 
         # Return params via dismiss callback
@@ -5,10 +5,18 @@ from textual.widgets import Header, Footer, ListView, ListItem, Label, Input, Bu
 from textual.containers import Container, Vertical
 from textual.binding import Binding
 from ..models import Project
+from .item_list import ItemListScreen
 
 logger = logging.getLogger("meridian_cli.screens.project_list")
 
 
+def _project_item(project: Project) -> ListItem:
+    """Build a list row for a project, with the project attached for selection"""
+    item = ListItem(Label(project.name), classes="project-item")
+    item.project_data = project
+    return item
+
+
 class NewProjectDialog(Screen):
     """Modal dialog for creating a new project"""
 
@@ -31,11 +39,12 @@ class NewProjectDialog(Screen):
         )
 
     def on_mount(self) -> None:
-        self.query_one("#project-name", Input).focus()
+        self._name_input = self.query_one("#project-name", Input)
+        self._name_input.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "create":
-            name = self.query_one("#project-name", Input).value.strip()
+            name = self._name_input.value.strip()
             if name:
                 self.dismiss(name)
         else:
@@ -45,9 +54,13 @@ class NewProjectDialog(Screen):
         self.dismiss(None)
 
 
-class ProjectListScreen(Screen):
+class ProjectListScreen(ItemListScreen):
     """Project selection/creation screen"""
 
+    LIST_ID = "project-list"
+    ITEM_CLASS = "project-item"
+    EMPTY_MESSAGE = "No projects yet. Press 'n' to create one."
+
     BINDINGS = [
         Binding("n", "new_project", "New Project"),
     ]
@@ -56,7 +69,7 @@ class ProjectListScreen(Screen):
         yield Header()
         yield Container(
             Label("Select a Project", classes="screen-title"),
-            ListView(id="project-list"),
+            ListView(id=self.LIST_ID),
         )
         yield Footer()
 
@@ -65,34 +78,18 @@ class ProjectListScreen(Screen):
         logger.info("ProjectList screen mounted")
         try:
             projects = await self.app.api_client.get_projects()
-            list_view = self.query_one("#project-list", ListView)
-
-            if not projects:
-                logger.debug("No projects found - showing empty state")
-                list_view.append(
-                    ListItem(Label("[dim]No projects yet. Press 'n' to create one.[/dim]"))
-                )
-            else:
-                logger.debug(f"Loaded {len(projects)} projects")
-                for project in projects:
-                    list_view.append(
-                        ListItem(
-                            Label(f"{project.name}"),
-                            classes="project-item",
-                        )
-                    )
-                    # Store project data on the list item
-                    list_view.children[-1].project_data = project
-
-            list_view.focus()
+            logger.debug("Loaded %d projects", len(projects))
+            await self.populate([_project_item(project) for project in projects])
+            if projects:
+                # Most recently updated project comes first - warm its chats
+                self.app.prefetch_chats(projects[0].id)
         except Exception as e:
-            logger.error(f"Error loading projects: {e}", exc_info=True)
-            self.app.notify(f"Error loading projects: {e}", severity="error", markup=False)
+            self.report_error("loading projects", e)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Navigate to chat list for selected project"""
-        if hasattr(event.item, "project_data"):
-            project = event.item.project_data
+        project = getattr(event.item, "project_data", None)
+        if project is not None:
             logger.info(f"Selected project: {project.name} (id={project.id})")
             self.app.current_project_id = project.id
             self.app.push_screen("chat_list")
@@ -114,11 +111,9 @@ class ProjectListScreen(Screen):
             logger.debug(f"Project created successfully: {project.id}")
             self.app.notify(f"Created project: {name}", severity="information")
 
-            # Reload project list
-            await self.on_mount()
+            await self.insert_first(_project_item(project))
         except Exception as e:
-            logger.error(f"Error creating project: {e}", exc_info=True)
-            self.app.notify(f"Error creating project: {e}", severity="error", markup=False)
+            self.report_error("creating project", e)
 
     def action_quit(self) -> None:
         """Quit the application"""
@@ -2,16 +2,48 @@
 
 import asyncio
 import logging
+import sys
+from typing import TYPE_CHECKING
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import RichLog, Static, Footer
-from textual.containers import Container
+from textual.containers import Container, VerticalScroll
 from textual.binding import Binding
 from rich.text import Text
-from ..models import Turn
+from ..rendering import turn_header_lines, block_lines
+
+if TYPE_CHECKING:
+    from ..models import Turn
 
 logger = logging.getLogger("meridian_cli.screens.streaming")
 
+# Streamed content is redrawn at most this often, however fast deltas arrive
+_REFRESH_INTERVAL = 1 / 30
+
+# Labels shown when a block starts, built once and copied into the stream
+_BLOCK_LABELS = {
+    "thinking": Text("[thinking]\n", style="dim"),
+    "text": Text("[text]\n", style="dim"),
+}
+
+
+def _block_label(block_type: str) -> Text:
+    """Label for a block, falling back to a fresh one for other block types (tool_use, image, etc.)"""
+    label = _BLOCK_LABELS.get(block_type)
+    if label is None:
+        label = Text(f"[{block_type}]\n", style="dim")
+    return label
+
+
+# Delta types rendered as text, and the block types that show them.
+# The API client interns delta types, so the hot cases match by identity.
+_TEXT_DELTA = sys.intern("text_delta")
+_THINKING_DELTA = sys.intern("thinking_delta")
+_INPUT_JSON_DELTA = sys.intern("input_json_delta")
+_TEXT_DELTAS = frozenset({_TEXT_DELTA, _THINKING_DELTA})
+_TEXTLIKE_BLOCKS = frozenset({"thinking", "text"})
+_JSON_BLOCKS = frozenset({"tool_use", "tool_result"})
+
 
 class StreamingScreen(Screen[str | None]):
     """Dedicated screen for streaming LLM responses
@@ -27,187 +59,191 @@ class StreamingScreen(Screen[str | None]):
         Binding("ctrl+c", "cancel", "Cancel", show=False),
     ]
 
-    def __init__(self, user_turn: Turn, assistant_turn: Turn):
+    def __init__(self, user_turn: "Turn", assistant_turn: "Turn"):
         super().__init__()
         self.user_turn = user_turn
         self.assistant_turn = assistant_turn
+        # Streamed pieces (plain str or styled Text) since the last flush.
+        # Appending to a list is all the per-delta work; _flush() assembles
+        # them once, moves finished lines into the log and keeps the
+        # unfinished last line in _tail.
+        self._pending: list[str | Text | tuple[str, str]] = []
+        self._tail = Text()
+        self._stream_task: asyncio.Task | None = None
+
+        # Stream state shared by the event handlers
+        self._current_block_type: str | None = None
+        self._debug = False
+        # SSE event type -> handler, bound once per screen
+        self._event_handlers = {
+            "block_start": self._on_block_start,
+            "block_delta": self._on_block_delta,
+            "turn_complete": self._on_turn_complete,
+        }
 
     def compose(self) -> ComposeResult:
         yield Container(
             RichLog(id="user-message-box", wrap=True, markup=True),
-            Static(id="streaming-box"),
+            # Finished lines are appended to the log once; only the line
+            # still being streamed is re-rendered on each flush
+            VerticalScroll(
+                RichLog(id="streaming-box", wrap=True, markup=False),
+                Static(id="streaming-tail"),
+                id="streaming-pane",
+            ),
             id="streaming-container",
         )
         yield Footer()
 
     async def on_mount(self) -> None:
         """Start streaming when screen is mounted"""
-        logger.info(f"StreamingScreen mounted for assistant turn: {self.assistant_turn.id}")
-        logger.debug(f"User turn ID: {self.user_turn.id}")
-        logger.debug(f"User turn has sibling_ids: {hasattr(self.user_turn, 'sibling_ids')}")
-        logger.debug(f"User turn has blocks: {hasattr(self.user_turn, 'blocks')}")
-        if hasattr(self.user_turn, 'blocks'):
-            logger.debug(f"User turn blocks count: {len(self.user_turn.blocks) if self.user_turn.blocks else 0}")
+        logger.info("StreamingScreen mounted for assistant turn: %s", self.assistant_turn.id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("User turn ID: %s", self.user_turn.id)
+            logger.debug("User turn sibling count: %d", len(self.user_turn.sibling_ids))
+            logger.debug("User turn blocks count: %d", len(self.user_turn.blocks))
 
         # Display user message in top box (formatted like turn_browser)
         user_box = self.query_one("#user-message-box", RichLog)
         user_box.clear()
-
-        # Metadata
-        turn_id_short = self.user_turn.id[:8]
-        user_box.write(f"[bold cyan]Turn ID:[/bold cyan] {turn_id_short}")
-        user_box.write(f"[bold cyan]Role:[/bold cyan] {self.user_turn.role}")
-        user_box.write(f"[bold cyan]Status:[/bold cyan] {self.user_turn.status}")
-
-        if self.user_turn.model:
-            user_box.write(f"[bold cyan]Model:[/bold cyan] {self.user_turn.model}")
-
-        if self.user_turn.error:
-            user_box.write(f"[red]Error:[/red] {self.user_turn.error}")
-
-        # Sibling info (if applicable)
-        if hasattr(self.user_turn, 'sibling_ids') and self.user_turn.sibling_ids and len(self.user_turn.sibling_ids) > 1:
-            idx = self.user_turn.sibling_index
-            total = len(self.user_turn.sibling_ids)
-            user_box.write(f"[dim]Sibling {idx + 1} of {total}[/dim]")
-
-        user_box.write("")  # Blank line
-
-        # Content blocks
-        if hasattr(self.user_turn, 'blocks') and self.user_turn.blocks:
-            for block in self.user_turn.blocks:
-                if block.block_type == "thinking":
-                    user_box.write("[dim][thinking][/dim]")
-                    if block.text_content:
-                        user_box.write(block.text_content)
-                    user_box.write("")
-                elif block.block_type == "text":
-                    user_box.write("[dim][text][/dim]")
-                    if block.text_content:
-                        user_box.write(block.text_content)
-                    user_box.write("")
-                else:
-                    # Other block types
-                    user_box.write(f"[dim][{block.block_type}][/dim]")
-                    user_box.write("")
-
-        # Start streaming in bottom box (run in background to avoid blocking UI)
-        self.run_worker(self.start_streaming())
+        lines = turn_header_lines(self.user_turn)
+        lines.append("")  # Blank line
+        lines.extend(block_lines(self.user_turn.blocks))
+        user_box.write("\n".join(lines))
+
+        # Streaming widgets are touched on every flush - look them up once
+        self._display = self.query_one("#streaming-box", RichLog)
+        self._tail_display = self.query_one("#streaming-tail", Static)
+        self._pane = self.query_one("#streaming-pane", VerticalScroll)
+
+        # Redraw on a fixed cadence rather than per delta
+        self.set_interval(_REFRESH_INTERVAL, self._flush)
+
+        # Start streaming in bottom box (run in background to avoid blocking UI).
+        # A plain task is enough for one coroutine and can be cancelled directly.
+        self._stream_task = asyncio.create_task(self.start_streaming())
+
+    def on_unmount(self) -> None:
+        """Stop reading the stream if the screen goes away mid-response"""
+        if self._stream_task and not self._stream_task.done():
+            self._stream_task.cancel()
+
+    def _flush(self) -> None:
+        """Push streamed content to the display if it changed since the last flush"""
+        if not self._pending:
+            return
+        text = Text.assemble(self._tail, *self._pending)
+        self._pending.clear()
+
+        lines = text.split("\n", allow_blank=True)
+        self._tail = lines.pop()
+        if lines:
+            # All lines completed since the last flush go in one write
+            self._display.write(Text("\n").join(lines))
+        self._tail_display.update(self._tail)
+        self._pane.scroll_end(animate=False)
 
     async def start_streaming(self) -> None:
         """Stream assistant response with block labels"""
-        logger.info(f"Starting streaming for assistant turn: {self.assistant_turn.id}")
+        logger.info("Starting streaming for assistant turn: %s", self.assistant_turn.id)
 
         try:
-            # Bottom box shows streaming content
-            display = self.query_one("#streaming-box", Static)
-
-            # Accumulate all content in Text object for real-time streaming
-            content = Text()
-
-            # Track current block type
-            current_block_type: str | None = None
+            # Checked once - handlers run per streamed token
+            self._debug = logger.isEnabledFor(logging.DEBUG)
+            handlers = self._event_handlers
 
             # Start SSE stream
             event_count = 0
-            async for event in self.app.api_client.stream_turn(self.assistant_turn.id):
+            async for event_type, data in self.app.api_client.stream_turn(self.assistant_turn.id):
                 event_count += 1
-                event_type = event.get("event")
-                data = event.get("data", {})
-
-                if event_type == "block_start":
-                    # New block starting - show label
-                    block_type = data.get("block_type")
-                    logger.debug(f"Block started: {block_type}")
-
-                    if block_type != current_block_type:
-                        current_block_type = block_type
-
-                        # Append block label to content
-                        if block_type:
-                            if block_type == "thinking":
-                                content.append("[thinking]\n", style="dim")
-                            elif block_type == "text":
-                                content.append("[text]\n", style="dim")
-                            else:
-                                # Other/unknown block types (tool_use, image, etc.)
-                                content.append(f"[{block_type}]\n", style="dim")
-
-                        # Update display with accumulated content
-                        display.update(content)
-
-                elif event_type == "block_delta":
-                    # Content delta - append text / JSON depending on delta type
-                    delta_type = data.get("delta_type")
-
-                    # Some backends may include block_type on deltas instead of a separate block_start
-                    block_type = data.get("block_type")
-                    if block_type and block_type != current_block_type:
-                        current_block_type = block_type
-                        if block_type == "thinking":
-                            content.append("[thinking]\n", style="dim")
-                        elif block_type == "text":
-                            content.append("[text]\n", style="dim")
-                        else:
-                            content.append(f"[{block_type}]\n", style="dim")
-                        display.update(content)
-
-                    # Text-like deltas (regular text and thinking text)
-                    if delta_type in ["text_delta", "thinking_delta"]:
-                        text = data.get("text_delta", "")
-                        if text and current_block_type in ["thinking", "text"]:
-                            content.append(text)
-                            display.update(content)
-
-                    # Tool input JSON deltas (streamed tool arguments)
-                    elif delta_type == "input_json_delta":
-                        json_delta = data.get("input_json_delta", "")
-                        if json_delta and current_block_type in ["tool_use", "tool_result"]:
-                            content.append(json_delta)
-                            display.update(content)
-                    else:
-                        # Other delta types (usage, signatures, etc.) are not rendered yet
-                        logger.debug(f"Ignoring unsupported block_delta type: {delta_type}")
-
-                elif event_type == "turn_complete":
-                    # Turn finished
-                    logger.debug("Turn completed")
-
-            logger.info(f"Streaming completed successfully - processed {event_count} events")
+                handler = handlers.get(event_type)
+                if handler is not None:
+                    handler(data)
+
+            logger.info("Streaming completed successfully - processed %d events", event_count)
 
             # Warn if no events received
             if event_count == 0:
-                content.append("\n[yellow]Warning: No events received from stream[/yellow]", style="yellow")
-                display.update(content)
+                self._pending.append(("\n[yellow]Warning: No events received from stream[/yellow]", "yellow"))
+                self._flush()
                 await asyncio.sleep(2)
 
             # Dismiss with assistant_turn_id to navigate to it
             self.dismiss(self.assistant_turn.id)
 
         except Exception as e:
-            logger.error(f"Streaming error: {e}", exc_info=True)
-
-            # Try to display error in UI (widget might not exist if error occurred during mount)
-            try:
-                display = self.query_one("#streaming-box", Static)
-                error_content = Text()
-                error_content.append("\nStreaming Error:\n", style="bold red")
-                error_content.append(f"{type(e).__name__}: {e}\n", style="red")
-                error_content.append("\nCheck logs for details", style="dim")
-                display.update(error_content)
-            except Exception as display_error:
-                # Widget doesn't exist yet - just log
-                logger.error(f"Failed to display error in UI (widget not mounted): {display_error}")
+            logger.error("Streaming error: %s", e, exc_info=True)
+
+            # Show it after whatever streamed before the failure. The display
+            # widgets are bound in on_mount before this task starts, and the
+            # pieces are assembled into one Text by the flush.
+            self._pending.extend((
+                ("\nStreaming Error:\n", "bold red"),
+                (f"{type(e).__name__}: {e}\n", "red"),
+                ("\nCheck logs for details", "dim"),
+            ))
+            self._flush()
 
             self.app.notify(f"Streaming error: {e}", severity="error", markup=False)
 
             # Wait 3 seconds before closing so user can see error
+            # (Esc cancels the task, which ends the wait immediately)
             await asyncio.sleep(3)
             self.dismiss(None)
 
+    def _on_block_start(self, data: dict) -> None:
+        """New block starting - show label"""
+        block_type = data.get("block_type")
+        if self._debug:
+            logger.debug("Block started: %s", block_type)
+
+        if block_type != self._current_block_type:
+            self._current_block_type = block_type
+
+            # Append block label to streamed content
+            if block_type:
+                self._pending.append(_block_label(block_type))
+
+    def _on_block_delta(self, data: dict) -> None:
+        """Content delta - append text / JSON depending on delta type"""
+        delta_type = data.get("delta_type")
+
+        # Some backends may include block_type on deltas instead of a separate block_start
+        block_type = data.get("block_type")
+        if block_type and block_type != self._current_block_type:
+            self._current_block_type = block_type
+            self._pending.append(_block_label(block_type))
+
+        # Text-like deltas (regular text and thinking text). The set lookup
+        # only runs when the identity checks miss (other delta types, or a
+        # caller that didn't intern).
+        if delta_type is _TEXT_DELTA or delta_type is _THINKING_DELTA or delta_type in _TEXT_DELTAS:
+            text = data.get("text_delta", "")
+            if text and self._current_block_type in _TEXTLIKE_BLOCKS:
+                self._pending.append(text)
+
+        # Tool input JSON deltas (streamed tool arguments)
+        elif delta_type == _INPUT_JSON_DELTA:
+            json_delta = data.get("input_json_delta", "")
+            if json_delta and self._current_block_type in _JSON_BLOCKS:
+                self._pending.append(json_delta)
+        else:
+            # Other delta types (usage, signatures, etc.) are not rendered yet
+            if self._debug:
+                logger.debug("Ignoring unsupported block_delta type: %s", delta_type)
+
+    def _on_turn_complete(self, data: dict) -> None:
+        """Turn finished - show the final content without waiting for the next tick"""
+        logger.debug("Turn completed")
+        self._flush()
+
     async def action_cancel(self) -> None:
         """Cancel streaming and close screen"""
-        logger.info(f"Cancelling streaming for turn: {self.assistant_turn.id}")
+        logger.info("Cancelling streaming for turn: %s", self.assistant_turn.id)
+
+        # Stop consuming events right away; the interrupt below ends the turn server-side
+        if self._stream_task and not self._stream_task.done():
+            self._stream_task.cancel()
 
         try:
             # Call interrupt API endpoint
@@ -220,7 +256,7 @@ class StreamingScreen(Screen[str | None]):
             self.dismiss(None)
 
         except Exception as e:
-            logger.error(f"Error cancelling stream: {e}", exc_info=True)
+            logger.error("Error cancelling stream: %s", e, exc_info=True)
             self.app.notify(f"Error cancelling stream: {e}", severity="error", markup=False)
 
             # Still close screen on error
@@ -1,40 +1,96 @@
 import asyncio
 import logging
+from collections import OrderedDict
+from itertools import product
+from typing import Final
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import RichLog, Footer
 from textual.reactive import reactive
 from textual.containers import Container
 from textual.binding import Binding
+from textual.timer import Timer
 from ..navigation import NavigationState
 from ..models import Turn, PaginatedTurnsResponse
+from ..rendering import turn_header_lines, block_lines
 from ..widgets import SubmittableTextArea
+from .confirmation import ConfirmationScreen
+from .params_editor import ParamsEditorScreen
+from .streaming import StreamingScreen
 
 logger = logging.getLogger("meridian_cli.screens.turn_browser")
 
+# Turns in these states can still change, so they are always re-fetched
+_VOLATILE_STATUSES = frozenset({"pending", "streaming", "waiting_subagents"})
+
+# Turn responses kept for instant navigation back to recently seen turns
+_TURN_CACHE_SIZE = 64
+
+# Navigation hint labels in display order (A, S, W, D). Unavailable directions
+# are blanked to the same width so the others don't shift.
+_HINT_LABELS = ("A: ← Prev", "S: ↓ Child", "W: ↑ Parent", "D: → Next")
+
+# Every hint line, keyed by (can_go_left, can_go_down, can_go_up, can_go_right)
+_HINT_LINES = {
+    flags: " | ".join(
+        label if available else " " * len(label)
+        for label, available in zip(_HINT_LABELS, flags)
+    )
+    for flags in product((False, True), repeat=4)
+}
+
+# Navigation directions: parent/child targets are read from the
+# NavigationState, siblings are stepped through by offset
+_TREE_TARGETS = {"up": "prev_turn_id", "down": "next_turn_id"}
+_SIBLING_OFFSETS = {"left": -1, "right": 1}
+
+# Keyboard navigation waits this long (seconds) for another keypress before fetching
+_NAV_DEBOUNCE = 0.04
+
+
+# Bindings are fixed for the life of the app, so they are one shared tuple
+_BINDINGS: Final = (
+    Binding("w", "navigate('up')", "W: ↑ Parent"),
+    Binding("s", "navigate('down')", "S: ↓ Child"),
+    Binding("a", "navigate('left')", "A: ← Prev Sibling"),
+    Binding("d", "navigate('right')", "D: → Next Sibling"),
+    Binding("p", "edit_params", "Params"),
+    Binding("tab", "focus_next", "Switch Focus", show=False),
+    Binding("escape", "go_back", "Back"),
+)
+
 
 class TurnBrowserScreen(Screen):
     """Main turn browser with two-box layout and arrow key navigation"""
 
-    BINDINGS = [
-        Binding("w", "navigate_up", "W: ↑ Parent"),
-        Binding("s", "navigate_down", "S: ↓ Child"),
-        Binding("a", "navigate_left", "A: ← Prev Sibling"),
-        Binding("d", "navigate_right", "D: → Next Sibling"),
-        Binding("p", "edit_params", "Params"),
-        Binding("tab", "focus_next", "Switch Focus", show=False),
-        Binding("escape", "go_back", "Back"),
-    ]
+    BINDINGS = _BINDINGS
 
     # Reactive state
     current_turn: reactive[Turn | None] = reactive(None)
     nav_state: reactive[NavigationState | None] = reactive(None)
 
+    # Both boxes, bound in on_mount
+    _display: RichLog
+    _input: SubmittableTextArea
+
     def __init__(self):
         super().__init__()
         self.chat_id = None
         self._navigation_task: asyncio.Task | None = None
 
+        # Responses for settled turns, keyed by turn ID, least recently used first
+        self._turn_cache: OrderedDict[str, PaginatedTurnsResponse] = OrderedDict()
+        # Bumped on every clear, so prefetches started before it are discarded
+        self._cache_generation = 0
+        # Neighbour turns being fetched in the background (and the tasks doing it)
+        self._prefetch_inflight: set[str] = set()
+        self._prefetch_tasks: set[asyncio.Task] = set()
+        # Uncached turn keyboard navigation is heading to, and its timer
+        self._pending_target: str | None = None
+        self._debounce_timer: Timer | None = None
+        # (header, blocks) as last rendered - see _render_signature
+        self._last_rendered_signature: tuple[tuple, tuple] | None = None
+
     def compose(self) -> ComposeResult:
         yield Container(
             RichLog(id="display-box", wrap=True, markup=True),
@@ -46,7 +102,11 @@ class TurnBrowserScreen(Screen):
     async def on_mount(self) -> None:
         """Initial load: GET /api/chats/{chat_id}/turns?limit=1&direction=after"""
         self.chat_id = self.app.current_chat_id
-        logger.info(f"TurnBrowser mounted for chat_id={self.chat_id}")
+        logger.info("TurnBrowser mounted for chat_id=%s", self.chat_id)
+
+        # Both boxes are touched on every navigation - look them up once
+        self._display = self.query_one("#display-box", RichLog)
+        self._input = self.query_one("#input-box", SubmittableTextArea)
 
         try:
             # Load first turn
@@ -54,29 +114,34 @@ class TurnBrowserScreen(Screen):
                 self.chat_id, limit=1, direction="after"
             )
 
-            if response.turns:
-                logger.debug(f"Loaded initial turn: {response.turns[0].id}")
-                self.nav_state = NavigationState(response.turns[0], response)
-                self.current_turn = response.turns[0]
+            turn = response.turns[0] if response.turns else None
+            if turn is not None:
+                logger.debug("Loaded initial turn: %s", turn.id)
+                self._cache_put(response)
+                self._show(turn, response)
                 self.update_display()
             else:
                 logger.debug("No turns in chat - showing empty state")
-                display = self.query_one("#display-box", RichLog)
-                display.write("[dim]No turns in this chat yet. Start typing below![/dim]")
+                self._display.write("[dim]No turns in this chat yet. Start typing below![/dim]")
 
             # Focus input box by default
-            self.query_one("#input-box", SubmittableTextArea).focus()
+            self._input.focus()
         except Exception as e:
-            logger.error(f"Error loading turns: {e}", exc_info=True)
+            logger.error("Error loading turns: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             self.app.notify(f"Error loading turns: {e}", severity="error", markup=False)
 
-    def watch_current_turn(self, turn: Turn | None) -> None:
+    def watch_current_turn(self, old_turn: Turn | None, turn: Turn | None) -> None:
         """Reactive: Update display when current_turn changes"""
-        if turn:
+        if not turn:
+            return
+        # Repaint the display and input lock together
+        with self.app.batch_update():
             self.update_display()
 
-            # Lock input if turn has error
-            input_box = self.query_one("#input-box", SubmittableTextArea)
+            # Lock input if turn has error (untouched when the error state is unchanged)
+            if old_turn is not None and old_turn.error == turn.error:
+                return
+            input_box = self._input
             if turn.error:
                 input_box.disabled = True
                 input_box.tooltip = f"Turn has error: {turn.error}"
@@ -84,140 +149,249 @@ class TurnBrowserScreen(Screen):
                 input_box.disabled = False
                 input_box.tooltip = None
 
+    def _render_signature(self) -> tuple[tuple, tuple] | None:
+        """Everything update_display shows as (header, blocks), for skipping no-op re-renders"""
+        turn = self.current_turn
+        if turn is None:
+            return None
+        nav = self.nav_state
+        header = (
+            turn.id,
+            turn.status,
+            turn.error,
+            len(turn.sibling_ids),
+            nav and (nav.can_go_up, nav.can_go_down, nav.can_go_left, nav.can_go_right),
+        )
+        blocks = tuple((block.block_type, block.text_content) for block in turn.blocks)
+        return header, blocks
+
     def update_display(self) -> None:
         """Render current turn in display box"""
-        display = self.query_one("#display-box", RichLog)
-        display.clear()
+        signature = self._render_signature()
+        last = self._last_rendered_signature
+        if signature is not None and signature == last:
+            return
+        self._last_rendered_signature = signature
 
-        if not self.current_turn:
+        display = self._display
+        turn = self.current_turn
+        if signature is None or turn is None:
+            display.clear()
             return
 
-        # Render turn metadata
-        turn_id_short = self.current_turn.id[:8]
-        display.write(f"[bold cyan]Turn ID:[/bold cyan] {turn_id_short}")
-        display.write(f"[bold cyan]Role:[/bold cyan] {self.current_turn.role}")
-        display.write(f"[bold cyan]Status:[/bold cyan] {self.current_turn.status}")
+        # Same turn and header, with the blocks already shown unchanged:
+        # only append the new blocks instead of rewriting the whole turn
+        if last is not None and signature[0] == last[0]:
+            rendered = len(last[1])
+            if signature[1][:rendered] == last[1]:
+                display.write("\n".join(block_lines(turn.blocks[rendered:])))
+                return
 
-        if self.current_turn.model:
-            display.write(f"[bold cyan]Model:[/bold cyan] {self.current_turn.model}")
+        display.clear()
+        nav = self.nav_state
 
-        if self.current_turn.error:
-            display.write(f"[red]Error:[/red] {self.current_turn.error}")
-
-        # Render sibling info
-        if self.current_turn.sibling_ids and len(self.current_turn.sibling_ids) > 1:
-            idx = self.current_turn.sibling_index
-            total = len(self.current_turn.sibling_ids)
-            display.write(f"[dim]Sibling {idx + 1} of {total}[/dim]")
+        lines = turn_header_lines(turn)
 
         # Navigation hints - always show all 4 directions (empty if unavailable)
-        if self.nav_state:
-            # Define labels with consistent padding
-            up_label = "W: ↑ Parent"
-            down_label = "S: ↓ Child"
-            left_label = "A: ← Prev"
-            right_label = "D: → Next"
-
-            hints = []
-
-            # A: Left (Prev Sibling)
-            hints.append(left_label if self.nav_state.can_go_left else " " * len(left_label))
-
-            # S: Down (Child)
-            hints.append(down_label if self.nav_state.can_go_down else " " * len(down_label))
-
-            # W: Up (Parent)
-            hints.append(up_label if self.nav_state.can_go_up else " " * len(up_label))
-
-            # D: Right (Next Sibling)
-            hints.append(right_label if self.nav_state.can_go_right else " " * len(right_label))
-
-            display.write(' | '.join(hints))
-
-        display.write("")  # Blank line
-
-        # Render content blocks
-        for block in self.current_turn.blocks:
-            if block.block_type == "thinking":
-                display.write("[dim][thinking][/dim]")
-                if block.text_content:
-                    display.write(block.text_content)
-                display.write("")
-            elif block.block_type == "text":
-                display.write("[dim][text][/dim]")
-                if block.text_content:
-                    display.write(block.text_content)
-                display.write("")
-            else:
-                # Other block types
-                display.write(f"[dim][{block.block_type}][/dim]")
-                display.write("")
+        if nav:
+            lines.append(_HINT_LINES[
+                nav.can_go_left,
+                nav.can_go_down,
+                nav.can_go_up,
+                nav.can_go_right,
+            ])
+
+        lines.append("")  # Blank line
+        lines.extend(block_lines(turn.blocks))
+
+        display.write("\n".join(lines))
 
     async def navigate_to_turn(self, turn_id: str) -> None:
         """Fetch and display a specific turn (cancels any pending navigation)"""
-        logger.debug(f"Navigating to turn: {turn_id}")
+        logger.debug("Navigating to turn: %s", turn_id)
         # Cancel any pending navigation request
         if self._navigation_task and not self._navigation_task.done():
             logger.debug("Cancelling pending navigation task")
+            # Not awaited: _do_navigate handles its own errors, so the
+            # cancelled task has nothing left to report
             self._navigation_task.cancel()
-            try:
-                await self._navigation_task
-            except asyncio.CancelledError:
-                pass  # Expected - we cancelled it
 
         # Create new task for this navigation
-        self._navigation_task = asyncio.create_task(self._do_navigate(turn_id))
+        task = self._navigation_task = asyncio.create_task(self._do_navigate(turn_id))
 
         # Await the task (so caller can handle exceptions)
         try:
-            await self._navigation_task
+            await task
         except asyncio.CancelledError:
             # This navigation was cancelled by a newer one - silent return
-            logger.debug(f"Navigation to {turn_id} was cancelled")
+            logger.debug("Navigation to %s was cancelled", turn_id)
 
     async def _do_navigate(self, turn_id: str) -> None:
         """Internal: Perform the actual navigation"""
         try:
-            response = await self.app.api_client.get_turns(
-                self.chat_id, from_turn_id=turn_id, limit=1, direction="after"
-            )
-
-            if response.turns:
-                logger.debug(f"Navigation successful - displaying turn {response.turns[0].id}")
-                self.nav_state = NavigationState(response.turns[0], response)
-                self.current_turn = response.turns[0]
+            response = self._cache_get(turn_id)
+            if response is None:
+                response = await self.app.api_client.get_turns(
+                    self.chat_id, from_turn_id=turn_id, limit=1, direction="after"
+                )
+                self._cache_put(response)
+
+            turn = response.turns[0] if response.turns else None
+            if turn is not None:
+                logger.debug("Navigation successful - displaying turn %s", turn.id)
+                self._show(turn, response)
         except Exception as e:
-            logger.error(f"Navigation error to turn {turn_id}: {e}", exc_info=True)
+            logger.error(
+                "Navigation error to turn %s: %s", turn_id, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             self.app.notify(f"Navigation error: {e}", severity="error", markup=False)
 
-    # Arrow key navigation actions
-    async def action_navigate_up(self) -> None:
-        """↑ key: Navigate to parent"""
-        if self.nav_state and self.nav_state.can_go_up and self.nav_state.prev_turn_id:
-            logger.debug(f"Navigation up - moving to parent turn {self.nav_state.prev_turn_id}")
-            await self.navigate_to_turn(self.nav_state.prev_turn_id)
-
-    async def action_navigate_down(self) -> None:
-        """↓ key: Navigate to child"""
-        if self.nav_state and self.nav_state.can_go_down and self.nav_state.next_turn_id:
-            logger.debug(f"Navigation down - moving to child turn {self.nav_state.next_turn_id}")
-            await self.navigate_to_turn(self.nav_state.next_turn_id)
-
-    async def action_navigate_left(self) -> None:
-        """← key: Navigate to previous sibling"""
-        if self.nav_state and self.nav_state.can_go_left and self.nav_state.prev_sibling_id:
-            logger.debug(f"Navigation left - moving to prev sibling {self.nav_state.prev_sibling_id}")
-            await self.navigate_to_turn(self.nav_state.prev_sibling_id)
-
-    async def action_navigate_right(self) -> None:
-        """→ key: Navigate to next sibling"""
-        if self.nav_state and self.nav_state.can_go_right and self.nav_state.next_sibling_id:
-            logger.debug(f"Navigation right - moving to next sibling {self.nav_state.next_sibling_id}")
-            await self.navigate_to_turn(self.nav_state.next_sibling_id)
+    def _show(self, turn: Turn, response: PaginatedTurnsResponse) -> None:
+        """Make a turn current (the first of its response) and warm its neighbours"""
+        self.nav_state = NavigationState(turn, response)
+        self.current_turn = turn
+        self._prefetch_neighbors(self.nav_state)
+
+    # Turn cache
+    def _cache_get(self, turn_id: str) -> PaginatedTurnsResponse | None:
+        response = self._turn_cache.get(turn_id)
+        if response is not None:
+            self._turn_cache.move_to_end(turn_id)
+        return response
+
+    def _cache_put(self, response: PaginatedTurnsResponse) -> None:
+        turn = response.turns[0] if response.turns else None
+        if turn is None or turn.status in _VOLATILE_STATUSES:
+            return
+        turn_id = turn.id
+        self._turn_cache[turn_id] = response
+        self._turn_cache.move_to_end(turn_id)
+        if len(self._turn_cache) > _TURN_CACHE_SIZE:
+            self._turn_cache.popitem(last=False)
+
+    def _cache_clear(self) -> None:
+        self._turn_cache.clear()
+        self._cache_generation += 1
+
+    def _prefetch_neighbors(self, nav_state: NavigationState) -> None:
+        """Fetch every turn one keypress away in the background"""
+        turn_ids = [
+            turn_id
+            for turn_id in (
+                nav_state.prev_turn_id,
+                nav_state.next_turn_id,
+                nav_state.prev_sibling_id,
+                nav_state.next_sibling_id,
+            )
+            if turn_id
+            and turn_id not in self._turn_cache
+            and turn_id not in self._prefetch_inflight
+        ]
+        if not turn_ids:
+            return
+        self._prefetch_inflight.update(turn_ids)
+        task = asyncio.create_task(self._prefetch(turn_ids, self._cache_generation))
+        # The event loop only holds weak references to tasks
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _prefetch(self, turn_ids: list[str], generation: int) -> None:
+        try:
+            results = await asyncio.gather(
+                *(
+                    self.app.api_client.get_turns(
+                        self.chat_id, from_turn_id=turn_id, limit=1, direction="after"
+                    )
+                    for turn_id in turn_ids
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            self._prefetch_inflight.difference_update(turn_ids)
+
+        if generation != self._cache_generation:
+            # The cache was cleared while these were in flight - they may be stale
+            return
+        for turn_id, result in zip(turn_ids, results):
+            # BaseException also covers a cancelled fetch
+            if isinstance(result, BaseException):
+                # Not user-facing - navigating there will fetch and report errors
+                logger.debug("Prefetch of turn %s failed: %r", turn_id, result)
+            else:
+                self._cache_put(result)
+
+    def on_unmount(self) -> None:
+        if self._navigation_task and not self._navigation_task.done():
+            self._navigation_task.cancel()
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+        for task in self._prefetch_tasks:
+            task.cancel()
+
+    # Debounced keyboard navigation
+    async def _navigate_soon(self, turn_id: str) -> None:
+        """Navigate on behalf of a keypress
+
+        Cached turns are shown immediately. Anything else waits briefly for
+        further presses, so holding a key fetches only the turn it stops on.
+        """
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+            self._debounce_timer = None
+
+        if turn_id in self._turn_cache:
+            self._pending_target = None
+            await self.navigate_to_turn(turn_id)
+            return
+
+        self._pending_target = turn_id
+        self._debounce_timer = self.set_timer(_NAV_DEBOUNCE, self._flush_navigation)
+
+    async def _flush_navigation(self) -> None:
+        """Navigate to the pending keyboard target, if any"""
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+            self._debounce_timer = None
+        turn_id, self._pending_target = self._pending_target, None
+        if turn_id is not None:
+            await self.navigate_to_turn(turn_id)
+
+    def _sibling_target(self, offset: int) -> str | None:
+        """Sibling `offset` steps from where keyboard navigation is heading
+
+        Siblings share one list, so repeated left/right presses can be
+        resolved locally from a pending target without fetching it first.
+        """
+        if self.current_turn is None:
+            return None
+        siblings = self.current_turn.sibling_ids
+        if self._pending_target in siblings:
+            idx = siblings.index(self._pending_target)
+        else:
+            idx = self.current_turn.sibling_index
+        idx += offset
+        if 0 <= idx < len(siblings):
+            return siblings[idx]
+        return None
+
+    # Arrow key navigation (one parameterized action for all four keys)
+    async def action_navigate(self, direction: str) -> None:
+        """W/S/A/D keys: Navigate to parent, child, or previous/next sibling"""
+        offset = _SIBLING_OFFSETS.get(direction)
+        if offset is not None:
+            target = self._sibling_target(offset)
+        else:
+            # Parent/child links come from the fetched turn - settle any pending move first
+            await self._flush_navigation()
+            nav = self.nav_state
+            target = nav and getattr(nav, _TREE_TARGETS[direction])
+        if target:
+            logger.debug("Navigation %s - moving to turn %s", direction, target)
+            await self._navigate_soon(target)
 
     def action_edit_params(self) -> None:
         """[p] key: Open params editor"""
-        from .params_editor import ParamsEditorScreen
 
         def on_params_updated(params: dict | None) -> None:
             if params:
@@ -227,7 +401,8 @@ class TurnBrowserScreen(Screen):
 
     def action_focus_next(self) -> None:
         """Tab key: Switch focus between boxes"""
-        self.screen.focus_next()
+        # Only the two boxes take focus here - toggle between them directly
+        (self._display if self._input.has_focus else self._input).focus()
 
     def action_go_back(self) -> None:
         """ESC key: Go back to chat list"""
@@ -250,7 +425,7 @@ class TurnBrowserScreen(Screen):
 
     def action_submit_input(self) -> None:
         """Enter key: Submit message from input box"""
-        input_box = self.query_one("#input-box", SubmittableTextArea)
+        input_box = self._input
 
         # Only submit if input box has focus
         if not input_box.has_focus:
@@ -264,11 +439,15 @@ class TurnBrowserScreen(Screen):
 
     def _handle_submission(self, content: str) -> None:
         """Common submission logic for both action and message handlers"""
-        input_box = self.query_one("#input-box", SubmittableTextArea)
+        input_box = self._input
 
-        # Show confirmation screen (lazy import to avoid circular dependency)
-        from .confirmation import ConfirmationScreen
+        # Short messages skip the confirmation round-trip when configured
+        if len(content) < self.app.confirm_min_chars:
+            self.app.call_later(self.submit_message, content)
+            input_box.text = ""
+            return
 
+        # Show confirmation screen
         def on_submit(should_submit: bool) -> None:
             if should_submit:
                 self.app.call_later(self.submit_message, content)
@@ -279,22 +458,27 @@ class TurnBrowserScreen(Screen):
 
     async def submit_message(self, content: str) -> None:
         """Create user turn and push streaming screen for assistant response"""
-        logger.info(f"Submitting message (length={len(content)}, prev_turn={self.current_turn.id if self.current_turn else None})")
+        prev_turn_id = self.current_turn.id if self.current_turn else None
+        logger.info("Submitting message (length=%d, prev_turn=%s)", len(content), prev_turn_id)
         try:
             # Create user turn (backend creates both user and assistant turns)
-            prev_turn_id = self.current_turn.id if self.current_turn else None
             create_response = await self.app.api_client.create_turn(
-                self.chat_id, prev_turn_id, content, self.app.current_params
+                self.chat_id, prev_turn_id, content, self.app.current_params_json
             )
 
-            logger.debug(f"Created turns - user: {create_response.user_turn.id}, assistant: {create_response.assistant_turn.id}")
+            logger.debug(
+                "Created turns - user: %s, assistant: %s",
+                create_response.user_turn.id, create_response.assistant_turn.id,
+            )
+
+            # The new turns change the parent's children and possibly
+            # sibling lists, so cached responses may now be stale
+            self._cache_clear()
 
             # Navigate to new user turn
             await self.navigate_to_turn(create_response.user_turn.id)
 
             # Push streaming screen for assistant response
-            from .streaming import StreamingScreen
-
             def on_streaming_done(assistant_turn_id: str | None) -> None:
                 """Reload assistant turn when streaming completes"""
                 if assistant_turn_id:
@@ -306,5 +490,6 @@ class TurnBrowserScreen(Screen):
             )
 
         except Exception as e:
-            logger.error(f"Error submitting message: {e}", exc_info=True)
+            # Tracebacks are only worth formatting when debugging
+            logger.error("Error submitting message: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             self.app.notify(f"Error submitting message: {e}", severity="error", markup=False)
@@ -3,6 +3,14 @@
 from textual.widgets import TextArea, Select
 from textual.binding import Binding
 from textual.message import Message
+from typing import Final
+
+
+# Submit on Enter takes priority over TextArea's own newline handling
+_SUBMITTABLE_BINDINGS: Final = (
+    Binding("enter", "submit", "Submit", priority=True, show=True),
+    Binding("ctrl+j", "insert_newline", "Newline", priority=True, show=True),
+)
 
 
 class SubmittableTextArea(TextArea):
@@ -13,10 +21,7 @@ class SubmittableTextArea(TextArea):
     Use Ctrl+J to insert a newline.
     """
 
-    BINDINGS = [
-        Binding("enter", "submit", "Submit", priority=True, show=True),
-        Binding("ctrl+j", "insert_newline", "Newline", priority=True, show=True),
-    ]
+    BINDINGS = _SUBMITTABLE_BINDINGS
 
     def action_insert_newline(self) -> None:
         """Insert a newline when Ctrl+J is pressed"""
@@ -33,6 +38,9 @@ class SubmittableTextArea(TextArea):
             text: The content of the text area when submitted
         """
 
+        # Message already defines __slots__, so this leaves instances without a __dict__
+        __slots__ = ("text",)
+
         def __init__(self, text: str) -> None:
             super().__init__()
             self.text = text